@@ -0,0 +1,58 @@
+"""
+Measure cold-start time to the first API call, with and without the on-disk token cache.
+
+Each run is a fresh Python process that builds a workspace client the way the self-service does
+and calls `current_user.me()`. Credentials are read from `.env` as in `main.py`.
+
+    python benchmarks/startup.py --runs 10 --environment dev
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FIRST_CALL = """
+from self_service.unitycatalog.token_cache import new_workspace_client
+new_workspace_client().current_user.me()
+"""
+
+def time_first_call(env: dict) -> float:
+    """ Return the seconds from process launch until the first API call has returned. """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', FIRST_CALL], env=env, cwd=ROOT, check=True)
+    return time.perf_counter() - start
+
+def report(label: str, timings: list) -> None:
+    print(f"{label:<10} median {statistics.median(timings) * 1000:8.1f} ms   "
+          f"min {min(timings) * 1000:8.1f} ms   max {max(timings) * 1000:8.1f} ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--environment', default='dev', choices=['dev', 'uat', 'prod'])
+    args = parser.parse_args()
+
+    load_dotenv(ROOT / '.env')
+    env = dict(os.environ, DATABRICKS_HOST=os.environ[f'DATABRICKS_HOST_{args.environment.upper()}'])
+    env.pop('SELF_SERVICE_TOKEN_CACHE', None)
+
+    uncached = [time_first_call(env) for _ in range(args.runs)]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cached_env = dict(env, SELF_SERVICE_TOKEN_CACHE='1', SELF_SERVICE_TOKEN_CACHE_PATH=str(Path(cache_dir) / 'oauth.json'))
+        time_first_call(cached_env)  # populate the cache
+        cached = [time_first_call(cached_env) for _ in range(args.runs)]
+
+    report('uncached', uncached)
+    report('cached', cached)
+    print(f"speedup    {statistics.median(uncached) / statistics.median(cached):.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,14 @@
 from typing import List, Optional
 from databricks.sdk.service import catalog
 from databricks.sdk import WorkspaceClient
+from .token_cache import new_workspace_client
 
 class Access:
-    def __init__(self) -> None:
+    def __init__(self, client: Optional[WorkspaceClient] = None) -> None:
         """
         Initialize Access by setting up a workspace client using environment variables. This base class
-        configures the client needed to interact with Databricks services.
+        configures the client needed to interact with Databricks services. An existing client can be
+        passed in to reuse its connection and credentials instead of building a new one.
 
         The purpose of this class is to provide a simpler and higher-level interface for managing access
         permissions in Unity Catalog. This security model uses three core access types (read, readwrite,
@@ -14,7 +16,7 @@ class Access:
         permission changes needed to achieve the desired access type.
         """
         
-        self._client = WorkspaceClient()
+        self._client = client or new_workspace_client()
 
     def _update_permissions(self, access_type: str, principal: str, action: str) -> None:
         """
@@ -49,13 +51,14 @@ class Access:
         return grants_info.privilege_assignments
 
 class CatalogAccess(Access):
-    def __init__(self, full_name: str) -> None:
+    def __init__(self, full_name: str, client: Optional[WorkspaceClient] = None) -> None:
         """Initialize CatalogAccess with specific catalog settings.
         
         Args:
             full_name (str): The full name of the catalog.
+            client (WorkspaceClient, optional): The workspace client to use.
         """
-        super().__init__()
+        super().__init__(client)
         self._full_name = full_name
 
     def _update_permissions(self, access_type: str, principal: str, action: str) -> None:
@@ -80,14 +83,15 @@ class CatalogAccess(Access):
         return super().list(catalog.SecurableType.CATALOG, self._full_name)
 
 class SchemaAccess(Access):
-    def __init__(self, catalog_name: str, schema_name: str) -> None:
+    def __init__(self, catalog_name: str, schema_name: str, client: Optional[WorkspaceClient] = None) -> None:
         """Initialize SchemaAccess with specific schema settings.
         
         Args:
             catalog_name (str): The name of the catalog.
             schema_name (str): The name of the schema.
+            client (WorkspaceClient, optional): The workspace client to use.
         """
-        super().__init__()
+        super().__init__(client)
         self._catalog_name = catalog_name
         self._schema_name = schema_name
         self._full_name = f"{catalog_name}.{schema_name}"
@@ -125,15 +129,16 @@ class SchemaAccess(Access):
         return super().list(catalog.SecurableType.SCHEMA, self._full_name)
 
 class TableAccess(Access):
-    def __init__(self, catalog_name: str, schema_name: str, table_name: str) -> None:
+    def __init__(self, catalog_name: str, schema_name: str, table_name: str, client: Optional[WorkspaceClient] = None) -> None:
         """Initialize SchemaAccess with specific schema settings.
         
         Args:
             catalog_name (str): The name of the catalog.
             schema_name (str): The name of the schema.
             table_name (str): The name of the table.
+            client (WorkspaceClient, optional): The workspace client to use.
         """
-        super().__init__()
+        super().__init__(client)
         self._catalog_name = catalog_name
         self._schema_name = schema_name
         self._table_name = table_name
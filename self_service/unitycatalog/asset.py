@@ -1,20 +1,62 @@
+import threading
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
 from databricks.sdk import WorkspaceClient
 from .access import CatalogAccess, SchemaAccess, TableAccess
 from .metadata import Metadata
+from .token_cache import new_workspace_client
 from databricks.sdk.service.catalog import IsolationMode, EnablePredictiveOptimization
 
+class _DefaultWorkspace:
+    def __init__(self) -> None:
+        """
+        Class attribute holding the workspace client shared by the asset classes. The client is built
+        on first use rather than at import, so importing this module needs no credentials.
+        """
+        self._workspace: Optional[WorkspaceClient] = None
+        self._lock = threading.Lock()
+
+    def __get__(self, obj: object, owner: type) -> WorkspaceClient:
+        with self._lock:
+            if self._workspace is None:
+                self._workspace = new_workspace_client()
+            return self._workspace
+
+class _WorkspaceService:
+    def __init__(self, name: str) -> None:
+        """ Class attribute resolving to one of the owner's workspace APIs, e.g. 'catalogs'. """
+        self._name = name
+
+    def __get__(self, obj: object, owner: type) -> Any:
+        return getattr(owner._workspace, self._name)  # type: ignore[attr-defined]
+
+_AssetsT = TypeVar('_AssetsT', bound='_Assets')
+
+class _Assets:
+    _workspace = _DefaultWorkspace()
+    _bound: Dict[Tuple[type, WorkspaceClient], type] = {}
+    _bound_lock = threading.Lock()
+
+    @classmethod
+    def bind(cls: Type[_AssetsT], workspace: WorkspaceClient) -> Type[_AssetsT]:
+        """ Return a variant of this class that runs against the given workspace client. """
+        with cls._bound_lock:
+            key = (cls, workspace)
+            if key not in cls._bound:
+                cls._bound[key] = type(cls.__name__, (cls,), {'_workspace': workspace})
+            return cls._bound[key]  # type: ignore[return-value]
+
 class Catalog:
-    def __init__(self, full_name: str):
+    def __init__(self, full_name: str, client: Optional[WorkspaceClient] = None):
         self._full_name = full_name
-        self.access = CatalogAccess(self._full_name)
-        self.metadata = Metadata(self._full_name)
+        self.access = CatalogAccess(self._full_name, client=client)
+        self.metadata = Metadata(self._full_name, client=client)
 
     def __repr__(self):
         return f'Catalog(catalog_name={self._full_name})'
 
-class Catalogs:
-    _client = WorkspaceClient().catalogs
-    _workspace_bindings = WorkspaceClient().workspace_bindings
+class Catalogs(_Assets):
+    _client = _WorkspaceService('catalogs')
+    _workspace_bindings = _WorkspaceService('workspace_bindings')
 
     @classmethod
     def create(cls, business_unit: str, environment: str):
@@ -38,7 +80,7 @@ class Catalogs:
         )
         
         # Assign only to the current workspace
-        current_workspace_id = WorkspaceClient().get_workspace_id()
+        current_workspace_id = cls._workspace.get_workspace_id()
         cls._workspace_bindings.update(name=catalog_name, assign_workspaces=[current_workspace_id])
 
 
@@ -51,28 +93,28 @@ class Catalogs:
     @classmethod
     def list(cls):
         catalog_infos = cls._client.list()
-        return [Catalog(full_name=info['name']) for info in catalog_infos]
+        return [Catalog(full_name=info.name, client=cls._workspace) for info in catalog_infos]
 
     @classmethod
     def get(cls, name: str) -> Catalog:
         catalog_info = cls._client.get(name=name)
         if catalog_info:
-            return Catalog(full_name=name)
+            return Catalog(full_name=name, client=cls._workspace)
         else:
             raise ValueError("Catalog not found")
 
 class Schema:
-    def __init__(self, catalog_name: str, schema_name: str):
+    def __init__(self, catalog_name: str, schema_name: str, client: Optional[WorkspaceClient] = None):
         self._catalog_name = catalog_name
         self.schema_name = schema_name
-        self.access = SchemaAccess(self._catalog_name, self.schema_name)
-        self.metadata = Metadata(f'{self._catalog_name}.{self.schema_name}')
+        self.access = SchemaAccess(self._catalog_name, self.schema_name, client=client)
+        self.metadata = Metadata(f'{self._catalog_name}.{self.schema_name}', client=client)
 
     def __repr__(self):
         return f'Schema(catalog_name={self._catalog_name}, schema_name={self.schema_name})'
 
-class Schemas:
-    _client = WorkspaceClient().schemas
+class Schemas(_Assets):
+    _client = _WorkspaceService('schemas')
 
     @classmethod
     def create(cls, catalog_name: str, schema_name: str):
@@ -85,29 +127,29 @@ class Schemas:
     @classmethod
     def list(cls, catalog_name: str):
         schema_infos = cls._client.list(catalog_name=catalog_name)
-        return [Schema(catalog_name=catalog_name, schema_name=info['name']) for info in schema_infos]
+        return [Schema(catalog_name=catalog_name, schema_name=info.name, client=cls._workspace) for info in schema_infos]
 
     @classmethod
     def get(cls, catalog_name: str, schema_name: str) -> Schema:
         schema_info = cls._client.get(full_name=f'{catalog_name}.{schema_name}')
         if schema_info:
-            return Schema(catalog_name=catalog_name, schema_name=schema_name)
+            return Schema(catalog_name=catalog_name, schema_name=schema_name, client=cls._workspace)
         else:
             raise ValueError("Schema not found")
         
 class Table:
-    def __init__(self, catalog_name: str, schema_name: str, table_name: str):
+    def __init__(self, catalog_name: str, schema_name: str, table_name: str, client: Optional[WorkspaceClient] = None):
         self._catalog_name = catalog_name
         self._schema_name = schema_name
         self._table_name = table_name
-        self.access = TableAccess(catalog_name, schema_name, table_name)
-        self.metadata = Metadata(f'{catalog_name}.{schema_name}.{table_name}')
+        self.access = TableAccess(catalog_name, schema_name, table_name, client=client)
+        self.metadata = Metadata(f'{catalog_name}.{schema_name}.{table_name}', client=client)
 
     def __repr__(self):
         return f'Table(catalog_name={self._catalog_name}, schema_name={self._schema_name}, table_name={self._table_name})'
 
-class Tables:
-    _client = WorkspaceClient().tables
+class Tables(_Assets):
+    _client = _WorkspaceService('tables')
 
     @classmethod
     def create(cls, catalog_name: str, schema_name: str, table_name: str):
@@ -120,13 +162,13 @@ class Tables:
     @classmethod
     def list(cls, catalog_name: str, schema_name: str):
         table_infos = cls._client.list(catalog_name=catalog_name, schema_name=schema_name)
-        return [Table(catalog_name=catalog_name, schema_name=schema_name, table_name=info.name) for info in table_infos]
+        return [Table(catalog_name=catalog_name, schema_name=schema_name, table_name=info.name, client=cls._workspace) for info in table_infos]
 
     @classmethod
     def get(cls, catalog_name: str, schema_name: str, table_name: str) -> Table:
         table_info = cls._client.get(full_name=f'{catalog_name}.{schema_name}.{table_name}')
         if table_info:
-            return Table(catalog_name=catalog_name, schema_name=schema_name, table_name=table_name)
+            return Table(catalog_name=catalog_name, schema_name=schema_name, table_name=table_name, client=cls._workspace)
         else:
             raise ValueError("Table not found")
         
@@ -1,6 +1,9 @@
+from typing import Dict
 from databricks.sdk import WorkspaceClient
+from self_service.unitycatalog.token_cache import new_workspace_client
 from self_service.unitycatalog.asset import Schemas
 import os
+import threading
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -10,15 +13,32 @@ DATABRICKS_HOST_PROD = os.getenv("DATABRICKS_HOST_PROD")
 DATABRICKS_CLIENT_ID = os.getenv('DATABRICKS_CLIENT_ID')
 DATABRICKS_CLIENT_SECRET = os.getenv('DATABRICKS_CLIENT_SECRET')
 
-def get_client(environment):
-    if environment == "dev":
-        return WorkspaceClient(host=DATABRICKS_HOST_DEV).schemas
-    elif environment == "uat":
-        return WorkspaceClient(host=DATABRICKS_HOST_UAT).schemas
-    elif environment == "prod":
-        return WorkspaceClient(host=DATABRICKS_HOST_PROD).schemas
-    else:
+_workspace_clients: Dict[str, WorkspaceClient] = {}
+_workspace_clients_lock = threading.Lock()
+
+def get_workspace_client(environment: str) -> WorkspaceClient:
+    """
+    Return the workspace client for an environment, building it on first use. Clients are kept for
+    the lifetime of the process so later calls reuse the same connection pool and OAuth token.
+    """
+    hosts = {
+        "dev": DATABRICKS_HOST_DEV,
+        "uat": DATABRICKS_HOST_UAT,
+        "prod": DATABRICKS_HOST_PROD
+    }
+    if environment not in hosts:
         raise ValueError(f"Unknown environment: {environment}")
+    if not hosts[environment]:
+        # Without a host the SDK would fall back to DATABRICKS_HOST, i.e. possibly another environment
+        raise ValueError(f"DATABRICKS_HOST_{environment.upper()} is not configured")
+
+    with _workspace_clients_lock:
+        if environment not in _workspace_clients:
+            _workspace_clients[environment] = new_workspace_client(host=hosts[environment])
+        return _workspace_clients[environment]
+
+def get_client(environment):
+    return get_workspace_client(environment).schemas
 
 def get_catalog_name(business_unit, environment):
     if environment == 'prod':
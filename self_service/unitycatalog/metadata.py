@@ -1,8 +1,10 @@
+from typing import Optional
 from databricks.sdk import WorkspaceClient
+from .token_cache import new_workspace_client
 
 class Metadata:
-    def __init__(self, full_name: str):
-        self.client = WorkspaceClient()
+    def __init__(self, full_name: str, client: Optional[WorkspaceClient] = None):
+        self.client = client or new_workspace_client()
         self.full_name = full_name
         self.securable_type = self._infer_securable_type()
 
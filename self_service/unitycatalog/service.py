@@ -0,0 +1,269 @@
+"""
+Long-lived local service for the self-service operations.
+
+Running each action as a fresh Python process pays for interpreter start, SDK import, client
+construction and OAuth token acquisition every time. This module keeps one warm workspace client
+per environment and exposes the asset, access and metadata operations over a Unix domain socket
+instead. Identical concurrent read requests are coalesced into a single upstream call.
+
+The socket is created with mode 0600 inside a directory only the current user can enter, so only
+processes running as that user can send requests. A missing socket directory is created with mode
+0700; an existing one must already be private, as its mode is never changed. It is not reachable from the network or from a
+web browser.
+
+Start the service with `python -m self_service.unitycatalog.service` and send one JSON request per
+line, such as:
+
+    {"environment": "dev", "operation": "access.list", "params": {"full_name": "elm_dev"}}
+
+Each request is answered with one JSON line holding either "result" or "error".
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+from dotenv import load_dotenv
+from databricks.sdk import WorkspaceClient
+from .access import CatalogAccess, SchemaAccess, TableAccess
+from .asset import Catalog, Catalogs, Schema, Schemas, Table, Tables
+from .metadata import Metadata
+from .devops.deploy import get_workspace_client
+
+load_dotenv()
+
+DEFAULT_SOCKET_PATH = Path.home() / '.cache' / 'gde-self-service' / 'service.sock'
+
+class SingleFlight:
+    def __init__(self) -> None:
+        """
+        Coalesce concurrent calls that share a key. The first caller for a key runs the function and
+        every caller that arrives while it is still running waits for, and receives, the same result.
+        Results are not cached once the call has finished.
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, '_Call'] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """ Run fn once for all concurrent callers with the same key and return its result. """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is None:
+                call = self._calls[key] = _Call()
+
+        if in_flight is not None:
+            return in_flight.wait()
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.wait()
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+def _access(workspace: WorkspaceClient, full_name: str) -> Union[CatalogAccess, SchemaAccess, TableAccess]:
+    """ Build the access object matching the level of the given full name. """
+    parts = full_name.split('.')
+    if len(parts) == 1:
+        return CatalogAccess(full_name, client=workspace)
+    elif len(parts) == 2:
+        catalog_name, schema_name = parts
+        return SchemaAccess(catalog_name, schema_name, client=workspace)
+    elif len(parts) == 3:
+        catalog_name, schema_name, table_name = parts
+        return TableAccess(catalog_name, schema_name, table_name, client=workspace)
+    else:
+        raise ValueError("Invalid full_name format")
+
+def _metadata(workspace: WorkspaceClient, full_name: str) -> Metadata:
+    return Metadata(full_name, client=workspace)
+
+# Operation name -> (handler, read only). Read-only operations are coalesced across callers.
+OPERATIONS: Dict[str, Tuple[Callable[..., Any], bool]] = {
+    'catalogs.create': (lambda ws, **kw: Catalogs.bind(ws).create(**kw), False),
+    'catalogs.delete': (lambda ws, **kw: Catalogs.bind(ws).delete(**kw), False),
+    'catalogs.list': (lambda ws, **kw: Catalogs.bind(ws).list(**kw), True),
+    'catalogs.get': (lambda ws, **kw: Catalogs.bind(ws).get(**kw), True),
+    'schemas.create': (lambda ws, **kw: Schemas.bind(ws).create(**kw), False),
+    'schemas.delete': (lambda ws, **kw: Schemas.bind(ws).delete(**kw), False),
+    'schemas.list': (lambda ws, **kw: Schemas.bind(ws).list(**kw), True),
+    'schemas.get': (lambda ws, **kw: Schemas.bind(ws).get(**kw), True),
+    'tables.list': (lambda ws, **kw: Tables.bind(ws).list(**kw), True),
+    'tables.get': (lambda ws, **kw: Tables.bind(ws).get(**kw), True),
+    'access.grant': (lambda ws, full_name, **kw: _access(ws, full_name).grant(**kw), False),
+    'access.revoke': (lambda ws, full_name, **kw: _access(ws, full_name).revoke(**kw), False),
+    'access.list': (lambda ws, full_name: _access(ws, full_name).list(), True),
+    'metadata.add_comment': (lambda ws, full_name, **kw: _metadata(ws, full_name).add_comment(**kw), False),
+    'metadata.remove_comment': (lambda ws, full_name: _metadata(ws, full_name).remove_comment(), False),
+    'metadata.add_property': (lambda ws, full_name, **kw: _metadata(ws, full_name).add_property(**kw), False),
+    'metadata.remove_property': (lambda ws, full_name, **kw: _metadata(ws, full_name).remove_property(**kw), False),
+}
+
+def _to_json(value: Any) -> Any:
+    """ Convert an operation result into something json.dumps can handle. """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, (Catalog, Schema, Table)):
+        return {'full_name': value.metadata.full_name}
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    raise TypeError(f"Cannot serialize result of type {type(value).__name__}")
+
+class SelfService:
+    def __init__(self, get_workspace: Callable[[str], WorkspaceClient] = get_workspace_client) -> None:
+        """
+        Dispatch operations against warm per-environment workspace clients.
+
+        Args:
+            get_workspace (Callable): Returns the (pooled) workspace client for an environment.
+        """
+        self._get_workspace = get_workspace
+        self._single_flight = SingleFlight()
+
+    def call(self, environment: str, operation: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run an operation in the given environment and return its JSON-ready result.
+
+        Args:
+            environment (str): The target environment ('dev', 'uat', or 'prod').
+            operation (str): The operation name, e.g. 'catalogs.get' or 'access.grant'.
+            params (dict, optional): Keyword arguments for the operation.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+        handler, read_only = OPERATIONS[operation]
+        params = dict(params or {})
+
+        # The catalog's environment decides its name and storage, so it must match the target workspace
+        if operation == 'catalogs.create' and params.setdefault('environment', environment) != environment:
+            raise ValueError(f"Cannot create a {params['environment']} catalog in the {environment} workspace")
+
+        workspace = self._get_workspace(environment)
+
+        def run() -> Any:
+            return _to_json(handler(workspace, **params))
+
+        if not read_only:
+            return run()
+        key = (environment, operation, json.dumps(params, sort_keys=True))
+        return self._single_flight.do(key, run)
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: '_Server'
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                result = self.server.service.call(request['environment'], request['operation'], request.get('params'))
+            except Exception as e:
+                response = {'error': f'{type(e).__name__}: {e}'}
+            else:
+                response = {'result': result}
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, service: SelfService) -> None:
+        self.service = service
+        self._path = path
+        super().__init__(str(path), _RequestHandler)
+
+    def server_bind(self) -> None:
+        # Create the socket file without group/other access so there is no window where it is open
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+        os.chmod(self._path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._path.unlink(missing_ok=True)
+
+def _prepare_socket_path(path: Path) -> None:
+    """
+    Check that the socket directory is private, creating it if it is missing, and remove a socket
+    left behind by a stopped service.
+
+    Raises:
+        PermissionError: If an existing socket directory is open to other users.
+    """
+    if not path.parent.exists():
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    directory = path.parent.stat()
+    if directory.st_uid != os.getuid() or directory.st_mode & 0o077:
+        raise PermissionError(f"{path.parent} must be owned by the current user and closed to group and others")
+
+    if path.exists() or path.is_symlink():
+        if not stat.S_ISSOCK(path.lstat().st_mode):
+            raise FileExistsError(f"{path} exists and is not a socket")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(str(path)) == 0:
+                raise RuntimeError(f"A self-service is already listening on {path}")
+        path.unlink()
+
+def create_server(path: Optional[Path] = None, service: Optional[SelfService] = None) -> socketserver.BaseServer:
+    """
+    Bind the self-service to its Unix domain socket without serving yet. Run serve_forever() on the
+    returned server, and shutdown() and server_close() to stop it and remove the socket.
+    """
+    path = Path(path or os.getenv('SELF_SERVICE_SOCKET') or DEFAULT_SOCKET_PATH)
+    _prepare_socket_path(path)
+    return _Server(path, service or SelfService())
+
+def serve(path: Optional[Path] = None, service: Optional[SelfService] = None) -> None:
+    """ Serve self-service operations on a Unix domain socket until interrupted. """
+    with create_server(path, service) as server:
+        print(f"Self-service listening on {server.server_address}")
+        server.serve_forever()
+
+def request(environment: str, operation: str, path: Optional[Path] = None, **params: Any) -> Any:
+    """
+    Send an operation to a running self-service and return its result.
+
+    Raises:
+        RuntimeError: If the service reports an error.
+    """
+    path = Path(path or os.getenv('SELF_SERVICE_SOCKET') or DEFAULT_SOCKET_PATH)
+    body = json.dumps({'environment': environment, 'operation': operation, 'params': params}).encode() + b'\n'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(body)
+        with sock.makefile('rb') as f:
+            response = json.loads(f.readline())
+    if 'error' in response:
+        raise RuntimeError(response['error'])
+    return response['result']
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the self-service as a long-lived local service.")
+    parser.add_argument('--socket', type=Path, help=f"Socket path (default: {DEFAULT_SOCKET_PATH})")
+    args = parser.parse_args()
+    serve(args.socket)
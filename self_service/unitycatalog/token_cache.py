@@ -0,0 +1,259 @@
+"""
+Opt-in on-disk cache of resolved OAuth configuration and M2M tokens.
+
+Every new process otherwise resolves the host's OIDC endpoints and fetches a fresh machine-to-machine
+OAuth token before its first API call. With the cache enabled, later processes reuse the token
+endpoint and any unexpired token stored for the same host, client id and client secret.
+
+Enable it by setting SELF_SERVICE_TOKEN_CACHE=1. The cache file defaults to
+~/.cache/gde-self-service/oauth.json and can be moved with SELF_SERVICE_TOKEN_CACHE_PATH. The file
+is written with mode 0600, and it is ignored unless both the file and its directory are owned by
+the current user and closed to group and others. A missing directory is created with mode 0700;
+the mode of an existing directory is never changed. Access is serialized across processes with a file
+lock. Client secrets are never written to disk; entries are keyed by a hash of the secret.
+"""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import stat
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from databricks.sdk import WorkspaceClient
+from databricks.sdk.config import Config
+from databricks.sdk.credentials_provider import CredentialsProvider, DefaultCredentials, HeaderFactory, credentials_provider
+from databricks.sdk.oauth import ClientCredentials, Token
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:  # Windows
+    HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = Path.home() / '.cache' / 'gde-self-service' / 'oauth.json'
+
+def is_enabled() -> bool:
+    """ Return True if the token cache is switched on and file locking is available. """
+    return HAS_FCNTL and os.getenv('SELF_SERVICE_TOKEN_CACHE', '').lower() in ('1', 'true', 'yes')
+
+def _is_private(st: os.stat_result) -> bool:
+    """ Return True if the file is owned by the current user and closed to group and others. """
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+class TokenCache:
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Initialize the cache backed by a JSON file keyed by host and client id.
+
+        Args:
+            path (Path, optional): The cache file. Defaults to SELF_SERVICE_TOKEN_CACHE_PATH or DEFAULT_PATH.
+        """
+        self.path = Path(path or os.getenv('SELF_SERVICE_TOKEN_CACHE_PATH') or DEFAULT_PATH)
+        self._lock_path = self.path.with_name(self.path.name + '.lock')
+        self._usable = False
+
+    @staticmethod
+    def key(host: str, client_id: str, client_secret: str) -> str:
+        secret_hash = hashlib.sha256(client_secret.encode()).hexdigest()
+        return f'{host}|{client_id}|{secret_hash}'
+
+    def _secure_directory(self) -> bool:
+        """
+        Create the cache directory if it is missing and check that only the current user can use it.
+        An existing directory that is open to others is left alone and the cache is not used.
+        """
+        directory = self.path.parent
+        try:
+            if not directory.exists():
+                directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            st = directory.stat()
+        except OSError as e:
+            logger.warning(f"Ignoring token cache: {e}")
+            return False
+        if not stat.S_ISDIR(st.st_mode) or not _is_private(st):
+            logger.warning(f"Ignoring token cache: {directory} is not private to the current user")
+            return False
+        return True
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the cache file across processes. If the cache directory can't be
+        trusted, the cache acts as empty and nothing is written.
+        """
+        fd = None
+        if self._secure_directory():
+            try:
+                fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+            except OSError as e:
+                logger.warning(f"Ignoring token cache: {e}")
+        if fd is None:
+            self._usable = False
+            yield
+            return
+        self._usable = True
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+            self._usable = False
+
+    def _read_entries(self) -> Dict[str, Any]:
+        """ Read all entries, ignoring a file that is corrupt or not private to the current user. """
+        if not self._usable:
+            return {}
+        try:
+            fd = os.open(self.path, os.O_RDONLY | os.O_NOFOLLOW)
+        except OSError:
+            return {}
+        with os.fdopen(fd) as f:
+            if not _is_private(os.fstat(fd)):
+                logger.warning(f"Ignoring token cache: {self.path} is not private to the current user")
+                return {}
+            try:
+                entries = json.load(f)
+            except ValueError:
+                return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def load(self, key: str) -> Dict[str, Any]:
+        """ Return the cached entry for a key, or an empty dict. Call while holding the lock. """
+        entry = self._read_entries().get(key)
+        return entry if isinstance(entry, dict) else {}
+
+    def store(self, key: str, entry: Dict[str, Any]) -> None:
+        """ Replace the cached entry for a key. Call while holding the lock. """
+        if not self._usable:
+            return
+        entries = self._read_entries()
+        entries[key] = entry
+
+        tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write token cache: {e}")
+
+class CachedClientCredentials:
+    def __init__(self, cfg: Config, cache: TokenCache) -> None:
+        """
+        Token source for Databricks M2M OAuth that shares tokens through the on-disk cache. Tokens
+        are kept in memory too, so the file is only touched when the current token has expired.
+        """
+        self._cfg = cfg
+        self._cache = cache
+        self._key = TokenCache.key(cfg.host, cfg.client_id, cfg.client_secret)
+        self._lock = threading.Lock()
+        self._token: Optional[Token] = None
+        self._token_endpoint: Optional[str] = None
+
+    def token_endpoint(self) -> Optional[str]:
+        """ Return the host's token endpoint, resolving it only when it is not cached yet. """
+        with self._cache.locked():
+            entry = self._cache.load(self._key)
+            if not entry.get('token_endpoint'):
+                oidc = self._cfg.oidc_endpoints
+                if oidc is None:
+                    return None
+                entry['token_endpoint'] = oidc.token_endpoint
+                self._cache.store(self._key, entry)
+            self._token_endpoint = entry['token_endpoint']
+            return self._token_endpoint
+
+    def _cached_token(self, entry: Dict[str, Any]) -> Optional[Token]:
+        """ Return the entry's token if it is well-formed and still valid, otherwise None. """
+        try:
+            token = Token.from_dict(entry['token'])
+            # Tokens without an expiry can't be checked for validity, so they are never reused
+            if token.expiry is None or not token.valid:
+                return None
+            return token
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+    def token(self) -> Token:
+        with self._lock:
+            if self._token is not None and self._token.valid:
+                return self._token
+            if self._token_endpoint is None:
+                raise ValueError("The token endpoint has not been resolved")
+            with self._cache.locked():
+                entry = self._cache.load(self._key)
+                cached = self._cached_token(entry)
+                if cached is not None:
+                    self._token = cached
+                else:
+                    self._token = ClientCredentials(client_id=self._cfg.client_id,
+                                                    client_secret=self._cfg.client_secret,
+                                                    token_url=self._token_endpoint,
+                                                    scopes=["all-apis"],
+                                                    use_header=True).token()
+                    entry['token'] = self._token.as_dict()
+                    self._cache.store(self._key, entry)
+            return self._token
+
+@credentials_provider('oauth-m2m', ['host', 'client_id', 'client_secret'])
+def cached_oauth_service_principal(cfg: Config) -> Optional[HeaderFactory]:
+    """ Same as the SDK's oauth-m2m provider, but backed by the on-disk token cache. """
+    token_source = CachedClientCredentials(cfg, TokenCache())
+    if token_source.token_endpoint() is None:
+        return None
+
+    def inner() -> Dict[str, str]:
+        token = token_source.token()
+        return {'Authorization': f'{token.token_type} {token.access_token}'}
+
+    return inner
+
+def _uses_oauth_m2m(cfg: Config) -> bool:
+    """
+    Return True if the SDK's default chain would reach oauth-m2m: no other auth type is enforced and
+    none of the providers it tries first (pat, basic, metadata-service) is configured.
+    """
+    if cfg.auth_type and cfg.auth_type != 'oauth-m2m':
+        return False
+    return not (cfg.token or (cfg.username and cfg.password) or cfg.metadata_service_url)
+
+class CachedCredentials(CredentialsProvider):
+    def __init__(self) -> None:
+        """
+        Use the cached M2M OAuth provider where the SDK's default credentials chain would use
+        oauth-m2m, and the default chain itself everywhere else, e.g. with a PAT, an explicit
+        auth type, or without OIDC endpoints. Enabling the cache never changes which credentials
+        are used.
+        """
+        self._default = DefaultCredentials()
+        self._auth_type = cached_oauth_service_principal.auth_type()  # type: ignore[attr-defined]
+
+    def auth_type(self) -> str:
+        return self._auth_type
+
+    def __call__(self, cfg: Config) -> HeaderFactory:
+        if _uses_oauth_m2m(cfg):
+            try:
+                header_factory = cached_oauth_service_principal(cfg)
+            except Exception as e:
+                raise ValueError(f'{self._auth_type}: {e}') from e
+            if header_factory is not None:
+                return header_factory
+        header_factory = self._default(cfg)
+        self._auth_type = self._default.auth_type()
+        return header_factory
+
+def new_workspace_client(**kwargs: Any) -> WorkspaceClient:
+    """
+    Build a WorkspaceClient, authenticating through the token cache when it is enabled. Otherwise
+    the SDK's default authentication is used.
+    """
+    if is_enabled() and 'credentials_provider' not in kwargs:
+        kwargs['credentials_provider'] = CachedCredentials()
+    return WorkspaceClient(**kwargs)
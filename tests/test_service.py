@@ -0,0 +1,110 @@
+import os
+import stat
+import threading
+import pytest
+from unittest.mock import Mock
+from databricks.sdk.service.catalog import CatalogInfo
+from self_service.unitycatalog.asset import Catalogs
+from self_service.unitycatalog.service import SelfService, SingleFlight, create_server, request
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 'result'
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(single_flight.do('key', fetch)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(single_flight.do('key', fetch))) for _ in range(5)]
+    for follower in followers:
+        follower.start()
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(calls) == 1, "Concurrent calls with the same key should run the function once"
+    assert results == ['result'] * 6
+
+def test_single_flight_shares_errors_and_does_not_cache():
+    single_flight = SingleFlight()
+
+    with pytest.raises(ValueError):
+        single_flight.do('key', Mock(side_effect=ValueError("Catalog not found")))
+    assert single_flight.do('key', lambda: 'retried') == 'retried'
+
+def test_self_service_reuses_environment_client():
+    workspace_client_mock = Mock()
+    workspace_client_mock.grants.get_effective.return_value.privilege_assignments = []
+    get_workspace = Mock(return_value=workspace_client_mock)
+    service = SelfService(get_workspace=get_workspace)
+
+    assert service.call('dev', 'access.list', {'full_name': 'elm_dev.curated'}) == []
+
+    get_workspace.assert_called_once_with('dev')
+    called_args, called_kwargs = workspace_client_mock.grants.get_effective.call_args
+    assert called_kwargs['full_name'] == 'elm_dev.curated'
+
+def test_self_service_unknown_operation():
+    service = SelfService(get_workspace=Mock())
+
+    with pytest.raises(ValueError):
+        service.call('dev', 'catalogs.rename', {})
+
+def test_self_service_serializes_assets():
+    workspace_client_mock = Mock()
+    workspace_client_mock.catalogs.list.return_value = [CatalogInfo(name="elm_dev")]
+    service = SelfService(get_workspace=Mock(return_value=workspace_client_mock))
+
+    assert service.call('dev', 'catalogs.list') == [{'full_name': 'elm_dev'}]
+
+def test_self_service_rejects_catalog_for_other_environment():
+    workspace_client_mock = Mock()
+    service = SelfService(get_workspace=Mock(return_value=workspace_client_mock))
+
+    with pytest.raises(ValueError):
+        service.call('dev', 'catalogs.create', {'business_unit': 'elm', 'environment': 'prod'})
+    workspace_client_mock.catalogs.create.assert_not_called()
+
+def test_serve_over_private_socket(tmp_path):
+    workspace_client_mock = Mock()
+    workspace_client_mock.grants.get_effective.return_value.privilege_assignments = []
+    socket_path = tmp_path / "service.sock"
+    # The socket is bound once create_server returns, so there is nothing to wait for
+    server = create_server(socket_path, SelfService(get_workspace=Mock(return_value=workspace_client_mock)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+        assert request('dev', 'access.list', path=socket_path, full_name='elm_dev') == []
+        with pytest.raises(RuntimeError):
+            request('dev', 'catalogs.rename', path=socket_path)
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+
+def test_shared_socket_directory_is_rejected(tmp_path):
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    os.chmod(shared_dir, 0o755)
+
+    with pytest.raises(PermissionError):
+        create_server(shared_dir / "service.sock", SelfService(get_workspace=Mock()))
+    assert stat.S_IMODE(shared_dir.stat().st_mode) == 0o755
+
+def test_bind_reuses_class_per_workspace():
+    workspace_client_mock = Mock()
+
+    assert Catalogs.bind(workspace_client_mock) is Catalogs.bind(workspace_client_mock)
+    assert Catalogs.bind(workspace_client_mock)._client is workspace_client_mock.catalogs
+    assert Catalogs.bind(workspace_client_mock) is not Catalogs.bind(Mock())
@@ -0,0 +1,180 @@
+import os
+import stat
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+import pytest
+from databricks.sdk.oauth import Token
+from self_service.unitycatalog.token_cache import CachedClientCredentials, CachedCredentials, TokenCache, new_workspace_client
+
+def mock_config():
+    cfg = Mock()
+    cfg.host = "https://adb-123.azuredatabricks.net"
+    cfg.client_id = "client"
+    cfg.client_secret = "secret"
+    cfg.auth_type = None
+    cfg.token = None
+    cfg.username = None
+    cfg.password = None
+    cfg.metadata_service_url = None
+    cfg.oidc_endpoints.token_endpoint = "https://adb-123.azuredatabricks.net/oidc/v1/token"
+    return cfg
+
+def new_token(expires_in):
+    return Token(access_token="access", token_type="Bearer", expiry=datetime.now() + timedelta(seconds=expires_in))
+
+def test_token_is_reused_across_processes(tmp_path):
+    cache = TokenCache(tmp_path / "oauth.json")
+
+    with patch("self_service.unitycatalog.token_cache.ClientCredentials") as client_credentials_mock:
+        client_credentials_mock.return_value.token.return_value = new_token(3600)
+
+        # Two token sources with separate configs stand in for two CLI processes
+        second_cfg = mock_config()
+        del second_cfg.oidc_endpoints  # resolving the endpoints again would raise
+        first = CachedClientCredentials(mock_config(), cache)
+        first.token_endpoint()
+        first.token()
+        second = CachedClientCredentials(second_cfg, cache)
+        assert second.token_endpoint() == "https://adb-123.azuredatabricks.net/oidc/v1/token"
+        token = second.token()
+
+    assert client_credentials_mock.call_count == 1, "The second process should reuse the cached token"
+    assert token.access_token == "access"
+
+def test_expired_token_is_refreshed(tmp_path):
+    cache = TokenCache(tmp_path / "oauth.json")
+    with cache.locked():
+        cache.store(TokenCache.key("https://adb-123.azuredatabricks.net", "client", "secret"), {
+            "token_endpoint": "https://adb-123.azuredatabricks.net/oidc/v1/token",
+            "token": new_token(-60).as_dict()
+        })
+
+    with patch("self_service.unitycatalog.token_cache.ClientCredentials") as client_credentials_mock:
+        client_credentials_mock.return_value.token.return_value = new_token(3600)
+        token_source = CachedClientCredentials(mock_config(), cache)
+        token_source.token_endpoint()
+        token = token_source.token()
+
+    client_credentials_mock.assert_called_once()
+    assert token.valid
+
+def test_cache_file_is_private(tmp_path):
+    cache = TokenCache(tmp_path / "cache" / "oauth.json")
+
+    with cache.locked():
+        cache.store("key", {"token_endpoint": "https://example.com/token"})
+        assert cache.load("key") == {"token_endpoint": "https://example.com/token"}
+
+    assert stat.S_IMODE(cache.path.stat().st_mode) == 0o600
+    assert "secret" not in cache.path.read_text()
+
+def test_malformed_token_is_a_cache_miss(tmp_path):
+    cache = TokenCache(tmp_path / "oauth.json")
+    with cache.locked():
+        cache.store(TokenCache.key("https://adb-123.azuredatabricks.net", "client", "secret"), {
+            "token_endpoint": "https://adb-123.azuredatabricks.net/oidc/v1/token",
+            "token": {"token_type": "Bearer", "expiry": "not a date"}
+        })
+
+    with patch("self_service.unitycatalog.token_cache.ClientCredentials") as client_credentials_mock:
+        client_credentials_mock.return_value.token.return_value = new_token(3600)
+        token_source = CachedClientCredentials(mock_config(), cache)
+        token_source.token_endpoint()
+        token = token_source.token()
+
+    client_credentials_mock.assert_called_once()
+    assert token.access_token == "access"
+
+def test_changed_secret_does_not_reuse_token(tmp_path):
+    cache = TokenCache(tmp_path / "oauth.json")
+
+    with patch("self_service.unitycatalog.token_cache.ClientCredentials") as client_credentials_mock:
+        client_credentials_mock.return_value.token.return_value = new_token(3600)
+        first = CachedClientCredentials(mock_config(), cache)
+        first.token_endpoint()
+        first.token()
+        rotated_cfg = mock_config()
+        rotated_cfg.client_secret = "rotated"
+        second = CachedClientCredentials(rotated_cfg, cache)
+        second.token_endpoint()
+        second.token()
+
+    assert client_credentials_mock.call_count == 2
+
+def test_cache_file_open_to_others_is_ignored(tmp_path):
+    cache = TokenCache(tmp_path / "cache" / "oauth.json")
+    with cache.locked():
+        cache.store("key", {"token_endpoint": "https://example.com/token"})
+    assert stat.S_IMODE(cache.path.parent.stat().st_mode) == 0o700
+
+    # Anything written while the file was writable by others can't be trusted
+    os.chmod(cache.path, 0o644)
+    with cache.locked():
+        assert cache.load("key") == {}
+
+@pytest.mark.parametrize("mode", [0o755, 0o1777])
+def test_existing_shared_directory_is_left_alone(tmp_path, mode):
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    os.chmod(shared_dir, mode)
+    cache = TokenCache(shared_dir / "oauth.json")
+
+    with cache.locked():
+        cache.store("key", {"token_endpoint": "https://example.com/token"})
+        assert cache.load("key") == {}
+
+    assert stat.S_IMODE(shared_dir.stat().st_mode) == mode
+    assert not cache.path.exists()
+
+def test_unusable_directory_is_a_cache_miss(tmp_path):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    cache = TokenCache(not_a_directory / "cache" / "oauth.json")
+
+    with cache.locked():
+        cache.store("key", {"token_endpoint": "https://example.com/token"})
+        assert cache.load("key") == {}
+
+def test_falls_back_to_default_credentials_without_oidc(tmp_path):
+    cfg = mock_config()
+    cfg.oidc_endpoints = None
+    credentials = CachedCredentials()
+    credentials._default = Mock(return_value="default header factory")
+    credentials._default.auth_type.return_value = "azure-client-secret"
+
+    with patch.dict(os.environ, {"SELF_SERVICE_TOKEN_CACHE_PATH": str(tmp_path / "oauth.json")}):
+        assert credentials(cfg) == "default header factory"
+    assert credentials.auth_type() == "azure-client-secret"
+
+def test_explicit_auth_type_bypasses_cache(tmp_path):
+    cfg = mock_config()
+    cfg.auth_type = "pat"
+    cfg.token = "dapi123"
+    credentials = CachedCredentials()
+    credentials._default = Mock(return_value="pat header factory")
+    credentials._default.auth_type.return_value = "pat"
+
+    assert credentials(cfg) == "pat header factory"
+    cfg.oidc_endpoints.assert_not_called()
+    assert not (tmp_path / "oauth.json").exists()
+
+def test_enabling_cache_keeps_explicit_auth_type(tmp_path):
+    environment = {
+        "SELF_SERVICE_TOKEN_CACHE": "1",
+        "SELF_SERVICE_TOKEN_CACHE_PATH": str(tmp_path / "oauth.json"),
+        "DATABRICKS_HOST": "https://adb-123.azuredatabricks.net",
+        "DATABRICKS_AUTH_TYPE": "pat",
+        "DATABRICKS_TOKEN": "dapi123",
+        "DATABRICKS_CLIENT_ID": "client",
+        "DATABRICKS_CLIENT_SECRET": "secret",
+    }
+    with patch.dict(os.environ, environment):
+        assert new_workspace_client().config.auth_type == "pat"
+
+def test_cached_provider_errors_are_wrapped(tmp_path):
+    cfg = mock_config()
+    type(cfg).oidc_endpoints = property(Mock(side_effect=ConnectionError("unreachable")))
+
+    with patch.dict(os.environ, {"SELF_SERVICE_TOKEN_CACHE_PATH": str(tmp_path / "oauth.json")}):
+        with pytest.raises(ValueError, match="oauth-m2m: unreachable"):
+            CachedCredentials()(cfg)